@@ -1,7 +1,6 @@
-import sys
 import argparse
 import os
-from image_processor import ImageProcessor
+from image_processor import ImageProcessor, list_image_files
 
 def parse_args():
     parser = argparse.ArgumentParser(description='Process comic pages for web publishing platforms')
@@ -32,6 +31,21 @@ def parse_args():
                        help='Use progressive JPEG output')
     parser.add_argument('--no-jpeg-progressive', dest='jpeg_progressive', action='store_false',
                        help='Do not use progressive JPEG output')
+    parser.add_argument('--png-compress-level', type=int, choices=range(10), default=1, metavar='{0-9}',
+                       help='PNG zlib compression level (0-9, default 1; 6 is smaller but much slower)')
+    parser.add_argument('--png-encoder', default='auto', choices=['auto', 'imagecodecs', 'opencv', 'pillow'],
+                       help='PNG writer (default: auto = imagecodecs, else OpenCV, else Pillow)')
+    parser.add_argument('--resize-backend', default='auto', choices=['auto', 'opencv', 'pillow', 'numpy'],
+                       help='Resize implementation (default: auto = Pillow-SIMD, else OpenCV, else Pillow)')
+    parser.add_argument('--filter', dest='resample_filter', default='bilinear',
+                       choices=['lanczos', 'bicubic', 'bilinear', 'box', 'hamming'],
+                       help='Resize filter (default bilinear; lanczos is sharper but several times slower)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Worker threads for non-sequence mode (default: half the CPU count)')
+    parser.add_argument('--io-workers', type=int, default=None,
+                       help='Background threads encoding output slices (default: same as --workers)')
+    parser.add_argument('--processes', dest='use_processes', action='store_true', default=False,
+                       help='Use worker processes instead of threads for non-sequence mode')
     
     return parser.parse_args()
 
@@ -51,8 +65,17 @@ def main():
         jpeg_subsampling=args.jpeg_subsampling,
         jpeg_optimize=args.jpeg_optimize,
         jpeg_progressive=args.jpeg_progressive,
+        png_compress_level=args.png_compress_level,
+        png_encoder=args.png_encoder,
+        max_workers=args.workers,
+        io_workers=args.io_workers,
+        resize_backend=args.resize_backend,
+        resample_filter=args.resample_filter,
+        use_processes=args.use_processes,
     )
     
+    print(f"Image backends: {processor.backend_info()}")
+
     # Create output directory if it doesn't exist
     os.makedirs(args.output, exist_ok=True)
     
@@ -63,10 +86,7 @@ def main():
             image_list = read_image_list(args.list_file)
         else:
             # read all files from directory (sorted)
-            image_list = []
-            for filename in sorted(os.listdir(args.input)):
-                if filename.lower().endswith(('.jpg', '.jpeg', '.png')):
-                    image_list.append(os.path.join(args.input, filename))
+            image_list = list_image_files(args.input)
         generated_files = processor.process_sequence_list(image_list, args.output, start_postfix=1, output_format=args.format)
     else:
         if args.list_file:
@@ -77,6 +97,8 @@ def main():
             # Process all images in directory
             generated_files = processor.process_directory(args.input, args.output, output_format=args.format)
     
+    processor.close()
+
     print(f"Processing complete. Generated {len(generated_files)} files:")
     for file in generated_files:
         print(f"  - {file}")
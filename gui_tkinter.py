@@ -8,10 +8,13 @@ Run with: python gui_tkinter.py
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import queue
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from PIL import Image, ImageTk
-from image_processor import ImageProcessor
+from image_processor import ImageProcessor, process_image_in_worker
 
 # Try to import sv_ttk theme; fall back gracefully if not available
 try:
@@ -141,7 +144,6 @@ class ReorderableImageList(ttk.Frame):
             sort_type (str): 'name', 'modified', or 'created'
         """
         import os
-        from datetime import datetime
         
         if sort_type == "name":
             self.images.sort(key=lambda x: os.path.basename(x[0]))
@@ -243,6 +245,10 @@ class Clip2lGUI:
         self.spinner_running = False
         self.spinner_thread = None
         self.spinner_index = 0
+        # Shared across runs so worker processes (and their imports) are reused;
+        # "spawn" avoids forking a process that has Tk loaded
+        self.pool = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 1) - 1),
+                                        mp_context=multiprocessing.get_context("spawn"))
 
         # Configure style with Sun Valley theme (or fall back to 'clam')
         style = ttk.Style()
@@ -339,6 +345,22 @@ class Clip2lGUI:
         self.jpeg_progressive_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(self.jpeg_options_frame, text="JPEG progressive", variable=self.jpeg_progressive_var).grid(row=3, column=0, columnspan=2, sticky=tk.W)
 
+        # PNG options: share the row with the JPEG options, visible only when format is png
+        self.png_options_frame = ttk.Frame(main_frame)
+        self.png_options_frame.grid(row=10, column=0, columnspan=2, sticky=tk.W, padx=(20,0), pady=(4,4))
+
+        ttk.Label(self.png_options_frame, text="PNG Compression:").grid(row=0, column=0, sticky=tk.W)
+        self.png_compress_level_var = tk.IntVar(value=1)
+        png_compress_spin = ttk.Spinbox(self.png_options_frame, from_=0, to=9, increment=1, textvariable=self.png_compress_level_var, width=8)
+        png_compress_spin.grid(row=0, column=1, sticky=tk.W)
+
+        ttk.Label(main_frame, text="Resize Filter:").grid(row=11, column=0, sticky=tk.W)
+        self.filter_var = tk.StringVar(value="bilinear")
+        filter_combo = ttk.Combobox(main_frame, textvariable=self.filter_var,
+                                    values=["bilinear", "lanczos", "bicubic", "hamming", "box"],
+                                    state="readonly", width=8)
+        filter_combo.grid(row=11, column=1, sticky=tk.W)
+
         self.sequence_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(main_frame, text="Sequence Mode (concatenate & slice across images)", 
                         variable=self.sequence_var).grid(row=14, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
@@ -350,6 +372,10 @@ class Clip2lGUI:
                 self.jpeg_options_frame.grid()
             else:
                 self.jpeg_options_frame.grid_remove()
+            if fmt == "png":
+                self.png_options_frame.grid()
+            else:
+                self.png_options_frame.grid_remove()
 
         self.format_var.trace_add("write", update_jpeg_options)
         update_jpeg_options()
@@ -387,6 +413,10 @@ class Clip2lGUI:
         main_frame.columnconfigure(0, weight=1)
         main_frame.rowconfigure(17, weight=1)
 
+        # Log lines are queued (from any thread) and flushed by the Tk loop every 100ms
+        self._log_queue = queue.Queue()
+        self.root.after(100, self._drain_log)
+
     def add_files(self):
         """Add files to the list."""
         files = filedialog.askopenfilenames(
@@ -422,10 +452,6 @@ class Clip2lGUI:
         sort_by = self.sort_var.get()
         self.image_list.sort_by(sort_by)
 
-    def update_files_list(self):
-        """Update the listbox display."""
-        pass  # No longer needed; handled by ReorderableImageList
-
     def browse_output(self):
         """Browse for output directory."""
         folder = filedialog.askdirectory(title="Select output directory")
@@ -433,12 +459,23 @@ class Clip2lGUI:
             self.output_var.set(folder)
 
     def log(self, message):
-        """Append message to log."""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
-        self.root.update()
+        """Append message to log. Safe to call from worker threads."""
+        self._log_queue.put(message)
+
+    def _drain_log(self):
+        """Insert queued log lines in one batch, then reschedule."""
+        lines = []
+        while True:
+            try:
+                lines.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if lines:
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            self.log_text.see(tk.END)
+            self.log_text.config(state=tk.DISABLED)
+        self.root.after(100, self._drain_log)
     
     def _start_spinner(self, status_message):
         """Start spinner animation with status message."""
@@ -535,12 +572,32 @@ class Clip2lGUI:
                 jpeg_subsampling=int(self.jpeg_subsampling_var.get()),
                 jpeg_optimize=self.jpeg_optimize_var.get(),
                 jpeg_progressive=self.jpeg_progressive_var.get(),
+                png_compress_level=self.png_compress_level_var.get(),
+                resample_filter=self.filter_var.get(),
             )
+            self.log(f"Backends: {processor.backend_info()}")
             
+            output_format = self.format_var.get()
             if sequence:
-                generated = processor.process_sequence_list(files, output_dir, output_format=self.format_var.get())
+                # Sequence slices depend on the previous image, so this stays in one thread
+                try:
+                    generated = processor.process_sequence_list(files, output_dir, output_format=output_format)
+                finally:
+                    processor.close()
             else:
-                generated = processor.process_image_list(files, output_dir, output_format=self.format_var.get())
+                # Images are independent once their start postfixes are known: farm them out.
+                # Workers save synchronously so no writer threads outlive a task in the pool
+                futures = {
+                    self.pool.submit(process_image_in_worker, processor, path, output_dir, postfix,
+                                     output_format=output_format): path
+                    for path, postfix in zip(files, processor.start_postfixes(files))
+                }
+                generated = []
+                for future in as_completed(futures):
+                    image_files, _ = future.result()
+                    generated.extend(image_files)
+                    name = os.path.basename(futures[future])
+                    self.log(f"{name}: {len(image_files)} file(s)")
 
             self.log("")
             self.log(f"✓ Processing complete!")
@@ -574,3 +631,4 @@ if __name__ == "__main__":
     root = tk.Tk()
     app = Clip2lGUI(root)
     root.mainloop()
+    app.pool.shutdown(cancel_futures=True)
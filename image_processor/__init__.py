@@ -1,3 +1,3 @@
-from .image_processor import ImageProcessor
+from .image_processor import ImageProcessor, list_image_files, process_image_in_worker
 
-__all__ = ["ImageProcessor"]
+__all__ = ["ImageProcessor", "list_image_files", "process_image_in_worker"]
@@ -0,0 +1,47 @@
+"""
+Numba kernel for `resample.resize`, kept in its own module so that Numba (slow to
+import) is only loaded once the NumPy resize backend is actually used.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def apply_sep_filter(src_u8, w_rows, idx_rows, w_cols, idx_cols, out_u8):
+    """
+    Separable banded convolution of `src_u8` (H, W, C) into `out_u8` (dst_h, dst_w, C).
+
+    `w_cols`/`idx_cols` and `w_rows`/`idx_rows` come from `filter_weights` for the
+    horizontal and vertical axis. Output rows are spread across cores with `prange`;
+    accumulation is float32 and the result is rounded and saturated to uint8.
+    """
+    src_h, _, channels = src_u8.shape
+    dst_h, dst_w, _ = out_u8.shape
+    col_taps = w_cols.shape[1]
+    row_taps = w_rows.shape[1]
+
+    # Horizontal pass: every source row to dst_w columns
+    tmp = np.empty((src_h, dst_w, channels), dtype=np.float32)
+    for y in prange(src_h):
+        for x in range(dst_w):
+            start = idx_cols[x]
+            for c in range(channels):
+                acc = np.float32(0.0)
+                for k in range(col_taps):
+                    acc += w_cols[x, k] * np.float32(src_u8[y, start + k, c])
+                tmp[y, x, c] = acc
+
+    # Vertical pass: accumulate whole rows so the inner loop is contiguous
+    for y in prange(dst_h):
+        start = idx_rows[y]
+        acc_row = np.zeros((dst_w, channels), dtype=np.float32)
+        for k in range(row_taps):
+            w = w_rows[y, k]
+            for x in range(dst_w):
+                for c in range(channels):
+                    acc_row[x, c] += w * tmp[start + k, x, c]
+        for x in range(dst_w):
+            for c in range(channels):
+                v = np.floor(acc_row[x, c] + np.float32(0.5))
+                out_u8[y, x, c] = 0 if v < 0 else (255 if v > 255 else np.uint8(v))
@@ -1,12 +1,106 @@
-from PIL import Image
+"""
+Resize-and-slice pipeline behind the Clip2l CLI and GUI.
+
+Resizing goes through Pillow's `Image.resize`, OpenCV or the NumPy resampler in
+`resample.py` (see `ImageProcessor.resize_backend`). Installing Pillow-SIMD in place of
+Pillow needs no code change: the same `Image.Resampling` filters then dispatch to its
+SSE4/AVX2 convolution, and `resize_backend='auto'` prefers it over OpenCV.
+"""
+
+import PIL
+from PIL import Image, features
+import contextlib
 import os
-from typing import List, Tuple, Optional
-import math
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+import multiprocessing
+from typing import Callable, List, Tuple, Optional, Union
+import numpy as np
+from .resample import has_numba, resize as numpy_resize
+
+# Try to import OpenCV for its multithreaded SIMD resize; fall back to Pillow if not available
+try:
+    import cv2
+    HAS_CV2 = True
+except ImportError:
+    HAS_CV2 = False
+
+# Try to load libjpeg-turbo through PyTurboJPEG to decode JPEGs straight into arrays;
+# TurboJPEG() raises when the shared library itself is missing
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbojpeg = TurboJPEG()
+    HAS_TURBOJPEG = True
+except (ImportError, OSError, RuntimeError):
+    HAS_TURBOJPEG = False
+
+# Try to import imagecodecs for its libpng + zlib-ng PNG encoder; fall back to OpenCV/Pillow
+try:
+    import imagecodecs
+    HAS_IMAGECODECS = True
+except ImportError:
+    HAS_IMAGECODECS = False
+
+# Pillow-SIMD is a drop-in Pillow fork with SSE4/AVX2 resize kernels; it tags its versions ".postN"
+HAS_PILLOW_SIMD = '.post' in PIL.__version__
+
+
+def _has_transparency_data(img: Image.Image) -> bool:
+    """`Image.has_transparency_data`, which Pillow-SIMD (9.x releases) lacks."""
+    if hasattr(img, 'has_transparency_data'):
+        return img.has_transparency_data
+    return 'transparency' in img.info or (img.mode == 'P' and img.palette.mode == 'RGBA')
+
+
+def list_image_files(input_dir: str, file_types: tuple = ('.jpg', '.jpeg', '.png')) -> List[str]:
+    """
+    List the image files directly inside `input_dir`, sorted by name.
+
+    Args:
+        input_dir (str): Directory to scan
+        file_types (tuple): Accepted file extensions (case-insensitive)
+
+    Returns:
+        List[str]: Paths of the matching files.
+    """
+    # scandir entries carry the file type, so no extra stat per file, and the
+    # extension check is a set lookup
+    extensions = frozenset(ext.lower() for ext in file_types)
+    with os.scandir(input_dir) as entries:
+        image_files = [entry.path for entry in entries
+                       if entry.is_file() and os.path.splitext(entry.name)[1].lower() in extensions]
+    image_files.sort()
+    return image_files
+
+
+# Resampling filters by name; OpenCV has no Hamming filter, so that one always uses Pillow.
+# The OpenCV backend enlarges with any of these but shrinks only with INTER_AREA ('box');
+# other shrinks go through Pillow (see `_resize_to_width`)
+PILLOW_FILTERS = {
+    'lanczos': Image.Resampling.LANCZOS,
+    'bicubic': Image.Resampling.BICUBIC,
+    'bilinear': Image.Resampling.BILINEAR,
+    'box': Image.Resampling.BOX,
+    'hamming': Image.Resampling.HAMMING,
+}
+CV2_FILTERS = {
+    'lanczos': 'INTER_LANCZOS4',
+    'bicubic': 'INTER_CUBIC',
+    'bilinear': 'INTER_LINEAR',
+    'box': 'INTER_AREA',
+}
+
 
 class ImageProcessor:
     def __init__(self, target_width: int, target_height: int, output_format: str = 'png',
                  jpeg_quality: int = 90, jpeg_subsampling: int = 0,
-                 jpeg_optimize: bool = True, jpeg_progressive: bool = False):
+                 jpeg_optimize: bool = True, jpeg_progressive: bool = False,
+                 png_compress_level: int = 1, max_workers: Optional[int] = None,
+                 resize_backend: str = 'auto', resample_filter: str = 'bilinear',
+                 use_processes: bool = False, png_encoder: str = 'auto',
+                 io_workers: Optional[int] = None):
         """
         Initialize the image processor with target dimensions.
         
@@ -18,6 +112,25 @@ class ImageProcessor:
             jpeg_subsampling (int): JPEG subsampling (0=4:4:4,1=4:2:2,2=4:2:0)
             jpeg_optimize (bool): Use Pillow JPEG optimization
             jpeg_progressive (bool): Save JPEG as progressive
+            png_compress_level (int): zlib level for PNG output (0-9). Level 1 encodes
+                several times faster than Pillow's default 6 for slightly larger files
+            max_workers (int, optional): Threads (or processes) used by `process_image_list`
+                (default: half the CPU count, at least 1). With resize_backend='numpy' and
+                Numba importable, only worker processes are used; the kernel is threaded already
+            resize_backend (str): Resize implementation: 'opencv', 'pillow', 'numpy'
+                (cached-weight NumPy convolution) or 'auto' (Pillow-SIMD, then OpenCV,
+                then Pillow, whichever is installed first)
+            resample_filter (str): Resize filter: 'lanczos', 'bicubic', 'bilinear', 'box'
+                or 'hamming'. BILINEAR is several times faster than LANCZOS and usually
+                indistinguishable at web widths; 'hamming' always resizes with Pillow
+            use_processes (bool): Run `process_image_list` on worker processes instead of
+                threads; avoids GIL contention for many small files. Callers must be
+                importable (`if __name__ == '__main__':` guard), workers are spawned
+            png_encoder (str): PNG writer: 'imagecodecs' (libpng linked with zlib-ng),
+                'opencv' (cv2.imwrite), 'pillow' or 'auto' (the first of these installed).
+                Both alternatives are faster than Pillow at the same zlib level
+            io_workers (int, optional): Background writer threads encoding queued slices
+                concurrently (default: `max_workers`). The encoders release the GIL
         """
         self.target_width = target_width
         self.target_height = target_height
@@ -26,6 +139,88 @@ class ImageProcessor:
         self.jpeg_subsampling = jpeg_subsampling if jpeg_subsampling in (0, 1, 2) else 0
         self.jpeg_optimize = jpeg_optimize
         self.jpeg_progressive = jpeg_progressive
+        self.png_compress_level = max(0, min(9, png_compress_level))
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 1) // 2)
+        self.use_processes = use_processes
+        self.io_workers = max(1, io_workers or self.max_workers)
+        backend = resize_backend.lower()
+        if backend == 'auto':
+            backend = 'opencv' if HAS_CV2 and not HAS_PILLOW_SIMD else 'pillow'
+        if backend not in ('opencv', 'pillow', 'numpy') or (backend == 'opencv' and not HAS_CV2):
+            raise ValueError(f"Unsupported resize backend: {resize_backend}")
+        self.resize_backend = backend
+        self.resample_filter = resample_filter.lower()
+        if self.resample_filter not in PILLOW_FILTERS:
+            raise ValueError(f"Unsupported resample filter: {resample_filter}")
+        # Resolved once here rather than looked up for every image
+        self._pillow_filter = PILLOW_FILTERS[self.resample_filter]
+        self._cv2_interpolation = (getattr(cv2, CV2_FILTERS[self.resample_filter])
+                                   if backend == 'opencv' and self.resample_filter in CV2_FILTERS
+                                   else None)
+        encoder = png_encoder.lower()
+        if encoder == 'auto':
+            encoder = 'imagecodecs' if HAS_IMAGECODECS else ('opencv' if HAS_CV2 else 'pillow')
+        if (encoder not in ('imagecodecs', 'opencv', 'pillow') or (encoder == 'opencv' and not HAS_CV2)
+                or (encoder == 'imagecodecs' and not HAS_IMAGECODECS)):
+            raise ValueError(f"Unsupported PNG encoder: {png_encoder}")
+        self.png_encoder = encoder
+
+        # Persistent slice buffer for sequence mode (not thread-safe: one sequence at a time)
+        self._slice_buf = np.empty((target_height, target_width, 3), dtype=np.uint8)
+        self._init_writer()
+
+    def backend_info(self) -> str:
+        """
+        Describe the backends this processor resizes, decodes and encodes with.
+
+        Returns:
+            str: Summary such as "resize: Pillow 12.0.0 (bilinear), JPEG: libjpeg-turbo,
+            PNG: imagecodecs".
+        """
+        pillow = f"Pillow-SIMD {PIL.__version__}" if HAS_PILLOW_SIMD else f"Pillow {PIL.__version__}"
+        if self.resize_backend == 'numpy':
+            resize = "NumPy + Numba" if has_numba() else "NumPy"
+        elif self._cv2_interpolation is None:
+            resize = pillow
+        elif self._cv2_interpolation == cv2.INTER_AREA:
+            resize = f"OpenCV {cv2.__version__}"
+        else:
+            resize = f"OpenCV {cv2.__version__} enlarging, {pillow} shrinking"
+        if HAS_TURBOJPEG:
+            jpeg = "PyTurboJPEG"
+        else:
+            jpeg = "libjpeg-turbo" if features.check_feature("libjpeg_turbo") else "libjpeg"
+        if self.png_encoder == 'opencv':
+            png = f"OpenCV {cv2.__version__}"
+        else:
+            png = "imagecodecs" if self.png_encoder == 'imagecodecs' else pillow
+        return f"resize: {resize} ({self.resample_filter}), JPEG: {jpeg}, PNG: {png}"
+
+    def _init_writer(self) -> None:
+        """
+        Set up the background writers: encoding and disk I/O overlap with decoding and
+        resizing the next image, and `io_workers` slices encode at once. The threads
+        start on first use (see `_write_async`) and stop when the public call that
+        started them returns (see `_writes_flushed`), so no thread outlives a call.
+        """
+        self._io_queue = queue.Queue(maxsize=max(8, 2 * self.io_workers))
+        self._writers = []
+        self._writer_lock = threading.Lock()
+        self._write_errors = []
+
+    def __getstate__(self) -> dict:
+        # Writer thread state can't be pickled; drop it so processors (and their bound
+        # methods) can be sent to worker processes, which set up their own writer.
+        # The slice buffer is dropped too rather than copied with every task.
+        state = self.__dict__.copy()
+        for key in ('_io_queue', '_writers', '_writer_lock', '_write_errors', '_slice_buf'):
+            del state[key]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._slice_buf = np.empty((self.target_height, self.target_width, 3), dtype=np.uint8)
+        self._init_writer()
 
     def image_convert(self, img: Image.Image, color_space: str = 'RGB', convert: bool = True) -> Image.Image:
         """
@@ -44,21 +239,260 @@ class ImageProcessor:
 
         # Target RGB: composite alpha/palette onto white background for stable output
         if color_space.upper() == 'RGB':
-            if img.mode in ("RGBA", "LA") or (hasattr(img, "getbands") and 'A' in img.getbands()):
-                rgba = img.convert('RGBA')
-                background = Image.new('RGBA', rgba.size, (255, 255, 255, 255))
-                background.paste(rgba, mask=rgba.split()[3])
-                return background.convert('RGB')
-            if img.mode == 'P':
-                rgba = img.convert('RGBA')
-                background = Image.new('RGBA', rgba.size, (255, 255, 255, 255))
-                background.paste(rgba, mask=rgba.split()[3])
-                return background.convert('RGB')
+            # Already RGB (the common JPEG case): the resize makes the new buffer anyway
+            if img.mode == 'RGB':
+                return img
+            # Palette without transparency (no 'transparency' entry, no RGBA palette)
+            # has nothing to composite
+            if img.mode == 'P' and not _has_transparency_data(img):
+                return img.convert('RGB')
+            # Same for an alpha band that is fully opaque (common for RGBA exports);
+            # the extrema scan covers the alpha band only
+            if img.mode in ("RGBA", "LA", "PA") and img.getchannel('A').getextrema()[0] == 255:
+                return img.convert('RGB')
+            if img.mode in ("P", "RGBA", "LA", "PA"):
+                if img.mode not in ("RGBA", "LA"):
+                    img = img.convert('RGBA')
+                # Paste the color bands onto a white RGB canvas with the alpha band as
+                # mask: one C blend pass, measured faster than both Image.alpha_composite
+                # (which needs RGBA canvas + convert back) and a NumPy blend
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                background.paste(img.convert('RGB'), mask=img.getchannel('A'))
+                return background
             return img.convert('RGB')
 
         # Other explicit conversions
         return img.convert(color_space)
 
+    def _scaled_height(self, width: int, height: int) -> int:
+        """Height of a `width` x `height` image once resized to `target_width`."""
+        # Integer arithmetic: int(tw / (w / h)) loses a row to float rounding for many
+        # heights, so pre-sized images would miss the no-resize path
+        return self.target_width * height // width
+
+    def _slice_count(self, image_path: str) -> int:
+        """Number of slices `process_image` will write for `image_path`, read from its header only."""
+        with Image.open(image_path) as img:
+            new_height = self._scaled_height(img.width, img.height)
+        th = self.target_height
+        return (new_height + th - 1) // th
+
+    def _load_resized(self, image_path: str) -> np.ndarray:
+        """
+        Decode `image_path`, normalize it to RGB and resize it to `target_width`.
+
+        The output height is computed from the header size, so it always matches
+        `_slice_count` even when the decoder scales the image down on load.
+
+        Args:
+            image_path (str): Path to the input image
+
+        Returns:
+            np.ndarray: uint8 array of shape (new_height, target_width, 3).
+        """
+        if HAS_TURBOJPEG and os.path.splitext(image_path)[1].lower() in ('.jpg', '.jpeg'):
+            resized = self._load_resized_turbojpeg(image_path)
+            if resized is not None:
+                return resized
+
+        with Image.open(image_path) as img:
+            new_height = self._scaled_height(img.width, img.height)
+            if img.format == 'JPEG':
+                # libjpeg can decode at 1/2, 1/4 or 1/8 scale (in the DCT domain) as long
+                # as the result stays at least target size; the sizes below are post-draft
+                img.draft('RGB', (self.target_width, new_height))
+            img = self.image_convert(img, 'RGB', convert=True)
+            return self._resize_to_width(img, new_height)
+
+    def _load_resized_turbojpeg(self, image_path: str) -> Optional[np.ndarray]:
+        """
+        JPEG variant of `_load_resized` decoding with libjpeg-turbo directly to RGB.
+
+        Returns:
+            Optional[np.ndarray]: Resized array, or None if libjpeg-turbo cannot decode
+            the file to RGB (e.g. CMYK), so the caller falls back to Pillow.
+        """
+        with open(image_path, 'rb') as f:
+            data = f.read()
+        try:
+            width, height, _, _ = _turbojpeg.decode_header(data)
+            new_height = self._scaled_height(width, height)
+            # Largest DCT-domain scale that still covers the output size, as draft() picks
+            scale = 1
+            while (scale < 8 and width // (scale * 2) >= self.target_width
+                   and height // (scale * 2) >= new_height):
+                scale *= 2
+            arr = _turbojpeg.decode(data, pixel_format=TJPF_RGB, scaling_factor=(1, scale))
+        except OSError:
+            return None
+        return self._resize_to_width(arr, new_height)
+
+    def _resize_to_width(self, img: Union[Image.Image, np.ndarray], new_height: int) -> np.ndarray:
+        """
+        Resize an RGB image to `target_width` x `new_height` with `resample_filter`.
+
+        Dispatch, in order:
+        1. Already at the output size: returned as-is.
+        2. Exact integer downscale with 'box' or 'bilinear': returned box-reduced by `reduce`.
+        3. A source at least 4x the target width is box-reduced to 2-4x it first.
+        4. OpenCV backend when enlarging, or shrinking with 'box' (INTER_AREA): `cv2.resize`.
+        5. NumPy backend: `resample.resize`.
+        6. Anything else (Pillow backend, other OpenCV shrinks, 'hamming'): `Image.resize`.
+
+        Args:
+            img (PIL.Image.Image or np.ndarray): RGB image (see `image_convert`).
+            new_height (int): Output height (see `_scaled_height`).
+
+        Returns:
+            np.ndarray: uint8 array of shape (new_height, target_width, 3).
+        """
+        tw = self.target_width
+        height, width = img.shape[:2] if isinstance(img, np.ndarray) else (img.height, img.width)
+        if width == tw and height == new_height:
+            # Already at output size (e.g. re-running on pre-sized images): nothing to resample
+            return np.asarray(img)
+        factor = width // tw
+        if (self.resample_filter in ('box', 'bilinear') and factor > 1
+                and width == tw * factor and height == new_height * factor):
+            # Exact integer ratio with a soft filter: averaging factor x factor blocks (a box
+            # filter) is far cheaper than the convolution and close to BILINEAR. Sharper
+            # filters are left alone; on screentone the difference is clearly visible
+            if isinstance(img, np.ndarray):
+                img = Image.fromarray(img)
+            return np.asarray(img.reduce(factor))
+        # Cheap integer box downsample first, keeping at least 2x target_width for the
+        # filtered pass, whose cost scales with the source size. Applies to arrays too,
+        # e.g. huge JPEGs still several times too large after libjpeg-turbo's 1/8 scale
+        prescale = width // (tw * 2)
+        if prescale > 1:
+            if isinstance(img, np.ndarray):
+                img = Image.fromarray(img)
+            img = img.reduce(prescale)
+        current_width = img.shape[1] if isinstance(img, np.ndarray) else img.width
+        # OpenCV's LINEAR/CUBIC/LANCZOS4 keep their kernel width when shrinking, so they
+        # alias (moiré on screentone); only INTER_AREA averages. Other filters shrink in
+        # Pillow, which widens the kernel with the scale
+        if self._cv2_interpolation is not None and (current_width <= tw
+                                                    or self._cv2_interpolation == cv2.INTER_AREA):
+            return cv2.resize(np.asarray(img), (tw, new_height), interpolation=self._cv2_interpolation)
+        if self.resize_backend == 'numpy':
+            return numpy_resize(np.asarray(img), tw, new_height, self.resample_filter)
+        # Pillow, including OpenCV's fallback for shrinking and for Hamming
+        if isinstance(img, np.ndarray):
+            img = Image.fromarray(img)
+        return np.asarray(img.resize((tw, new_height), self._pillow_filter))
+
+    def _save_array(self, arr: np.ndarray, output_path: str, save_format: str) -> None:
+        """Save an RGB uint8 array (or a row-slice view of one) to `output_path`."""
+        # Leading-axis slices of C-contiguous arrays stay contiguous, so every encoder
+        # reads them in place; a strided view here would mean a hidden copy per slice
+        assert arr.flags.c_contiguous, f"Non-contiguous slice for {output_path}: strides {arr.strides}"
+        if save_format == 'PNG' and self.png_encoder == 'imagecodecs':
+            self._write_bytes(output_path, memoryview(imagecodecs.png_encode(arr, level=self.png_compress_level)))
+            return
+        if save_format == 'PNG' and self.png_encoder == 'opencv':
+            bgr = cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
+            ok, encoded = cv2.imencode('.png', bgr, [cv2.IMWRITE_PNG_COMPRESSION, self.png_compress_level])
+            if not ok:
+                raise OSError(f"Could not encode {output_path}")
+            self._write_bytes(output_path, memoryview(encoded))
+            return
+        Image.fromarray(arr).save(output_path, save_format, **self._save_kwargs(save_format))
+
+    @staticmethod
+    def _write_bytes(output_path: str, data: memoryview) -> None:
+        """Write an encoded image with unbuffered os.write calls, no file object or copy."""
+        # O_BINARY (Windows only) stops newline translation from corrupting the file;
+        # 0o666 leaves the permissions to the umask, as open(path, 'wb') does
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    def _write_async(self, arr: np.ndarray, output_path: str, save_format: str,
+                     on_done: Optional[Callable[[], None]] = None) -> None:
+        """
+        Queue `arr` for the background writers. `arr` must not be modified until it is
+        written; `on_done` is called (on a writer thread) once it has been.
+        """
+        with self._writer_lock:
+            if not self._writers:
+                for _ in range(self.io_workers):
+                    writer = threading.Thread(target=self._writer_loop, daemon=True)
+                    writer.start()
+                    self._writers.append(writer)
+        self._io_queue.put((arr, output_path, save_format, on_done))
+
+    def _writer_loop(self) -> None:
+        """Save queued slices until a `None` sentinel arrives."""
+        while True:
+            item = self._io_queue.get()
+            try:
+                if item is None:
+                    return
+                arr, output_path, save_format, on_done = item
+                try:
+                    self._save_array(arr, output_path, save_format)
+                except Exception as e:
+                    self._write_errors.append(e)
+                if on_done is not None:
+                    on_done()
+            finally:
+                self._io_queue.task_done()
+
+    def _wait_for_writes(self, raise_errors: bool = True) -> None:
+        """
+        Block until all queued slices are written, stop the writer threads and
+        re-raise the first write error.
+        """
+        with self._writer_lock:
+            writers, self._writers = self._writers, []
+        # Sentinels queue behind every pending slice, so each writer exits only once
+        # the slices ahead of it are saved
+        for _ in writers:
+            self._io_queue.put(None)
+        for writer in writers:
+            writer.join()
+        if self._write_errors:
+            error = self._write_errors[0]
+            self._write_errors.clear()
+            if raise_errors:
+                raise error
+
+    @contextlib.contextmanager
+    def _writes_flushed(self):
+        """
+        Wait for queued writes and stop the writers when the block exits, also when it
+        raises: writers may still be reading `_slice_buf` or other arrays the next call
+        reuses, their errors must not surface in an unrelated later call, and running
+        writer threads (bound to this processor) would keep it from being collected.
+        An error raised by the block itself takes precedence over write errors.
+        """
+        try:
+            yield
+        except BaseException:
+            self._wait_for_writes(raise_errors=False)
+            raise
+        self._wait_for_writes()
+
+    def close(self) -> None:
+        """
+        Kept for existing callers: writer threads already stop before each public call
+        returns, so there is nothing left to release and processors need no cleanup.
+        """
+        self._wait_for_writes()
+
+    def _save_kwargs(self, save_format: str) -> dict:
+        """Return Pillow save kwargs for `save_format` based on processor settings."""
+        if save_format == 'JPEG':
+            return self._jpeg_save_kwargs()
+        if save_format == 'PNG':
+            # optimize=True would override compress_level with a slow level-9 search
+            return {'compress_level': self.png_compress_level, 'optimize': False}
+        return {}
+
     def _jpeg_save_kwargs(self) -> dict:
         """Return JPEG save kwargs based on processor settings."""
         return {
@@ -82,6 +516,13 @@ class ImageProcessor:
         Returns:
             Tuple[List[str], int]: (generated file paths, next postfix number)
         """
+        with self._writes_flushed():
+            return self._slice_image(image_path, output_dir, start_postfix, output_format, self._write_async)
+
+    def _slice_image(self, image_path: str, output_dir: str, start_postfix: int,
+                     output_format: Optional[str],
+                     save: Callable[[np.ndarray, str, str], None]) -> Tuple[List[str], int]:
+        """`process_image` body; slices are handed to `save` (sync or queued writer)."""
         os.makedirs(output_dir, exist_ok=True)
         base_name = os.path.splitext(os.path.basename(image_path))[0]
         generated_files = []
@@ -100,26 +541,50 @@ class ImageProcessor:
         else:
             raise ValueError(f"Unsupported output format: {output_format or self.output_format}")
 
-        with Image.open(image_path) as img:
-            # Normalize/convert input image
-            img = self.image_convert(img, 'RGB', convert=True)
+        # Joined once; each slice only formats its postfix onto the prefix
+        path_prefix = os.path.join(output_dir, f"{base_name}_")
 
-            aspect_ratio = img.width / img.height
-            new_height = int(self.target_width / aspect_ratio)
-            resized_img = img.resize((self.target_width, new_height), Image.Resampling.LANCZOS)
-            num_slices = math.ceil(new_height / self.target_height)
-            for i in range(num_slices):
-                start_y = i * self.target_height
-                end_y = min(start_y + self.target_height, new_height)
-                slice_img = resized_img.crop((0, start_y, self.target_width, end_y))
-                postfix = start_postfix + i
-                output_filename = f"{base_name}_{postfix:03d}.{fmt_ext}"
-                output_path = os.path.join(output_dir, output_filename)
-                save_kwargs = self._jpeg_save_kwargs() if save_format == 'JPEG' else {}
-                slice_img.save(output_path, save_format, **save_kwargs)
-                generated_files.append(output_path)
-        next_postfix = start_postfix + len(generated_files)
-        return generated_files, next_postfix
+        th = self.target_height
+        resized = self._load_resized(image_path)
+        new_height = resized.shape[0]
+        num_slices = (new_height + th - 1) // th
+        if num_slices == 1:
+            # Fits in one slice: save the resized array as-is, no slicing loop
+            output_path = f"{path_prefix}{start_postfix:03d}.{fmt_ext}"
+            save(resized, output_path, save_format)
+            return [output_path], start_postfix + 1
+
+        for i in range(num_slices):
+            start_y = i * th
+            end_y = min(start_y + th, new_height)
+            # Row slices of a C-contiguous array are views, no pixel copy
+            slice_arr = resized[start_y:end_y]
+            output_path = f"{path_prefix}{start_postfix + i:03d}.{fmt_ext}"
+            save(slice_arr, output_path, save_format)
+            generated_files.append(output_path)
+        return generated_files, start_postfix + num_slices
+
+    def start_postfixes(self, image_list: List[str], start_postfix: int = 1) -> List[int]:
+        """
+        Compute the starting postfix `process_image` should use for each image so the
+        numbering is continuous, without decoding pixels.
+
+        Image.open only parses headers, so this lets a batch be processed out of order
+        (threads, processes) with the same output names as a sequential run.
+
+        Args:
+            image_list (List[str]): List of paths to input images
+            start_postfix (int): Postfix of the first output file
+
+        Returns:
+            List[int]: Starting postfix per image, in input order
+        """
+        postfixes = []
+        postfix_counter = start_postfix
+        for image_path in image_list:
+            postfixes.append(postfix_counter)
+            postfix_counter += self._slice_count(image_path)
+        return postfixes
 
     def process_image_list(self, image_list: List[str], output_dir: str, output_format: Optional[str] = None) -> List[str]:
         """
@@ -135,9 +600,39 @@ class ImageProcessor:
         """
         all_generated_files = []
         postfix_counter = 1
-        for image_path in image_list:
-            generated_files, postfix_counter = self.process_image(image_path, output_dir, postfix_counter, output_format=output_format)
-            all_generated_files.extend(generated_files)
+        # The Numba kernel behind resize_backend='numpy' is multithreaded itself and must
+        # not be entered from several threads at once, so that backend never uses the
+        # thread pool (worker processes are fine)
+        numba_resize = self.resize_backend == 'numpy' and has_numba()
+        if self.max_workers <= 1 or len(image_list) <= 1 or (numba_resize and not self.use_processes):
+            with self._writes_flushed():
+                for image_path in image_list:
+                    generated_files, postfix_counter = self._slice_image(image_path, output_dir, postfix_counter,
+                                                                         output_format, self._write_async)
+                    all_generated_files.extend(generated_files)
+            return all_generated_files
+
+        start_postfixes = self.start_postfixes(image_list)
+
+        if self.use_processes:
+            # The processor is pickled to each worker without its writer (see __getstate__);
+            # spawn rather than fork so workers don't inherit the writer thread's locks
+            with ProcessPoolExecutor(max_workers=self.max_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                results = executor.map(process_image_in_worker, repeat(self), image_list,
+                                       repeat(output_dir), start_postfixes, repeat(output_format))
+                for generated_files, _ in results:
+                    all_generated_files.extend(generated_files)
+            return all_generated_files
+
+        # Decode, resize and encode release the GIL, so threads scale with cores. Each
+        # worker saves its own slices, so no queue hand-off is needed on top of the pool.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(
+                lambda job: self._slice_image(job[0], output_dir, job[1], output_format, self._save_array),
+                zip(image_list, start_postfixes))
+            for generated_files, _ in results:
+                all_generated_files.extend(generated_files)
         return all_generated_files
 
     def process_sequence_list(self, image_list: List[str], output_dir: str, start_postfix: int = 1,
@@ -171,121 +666,54 @@ class ImageProcessor:
         else:
             raise ValueError(f"Unsupported output format: {output_format or self.output_format}")
 
-        # Process images one by one and stream output slices. We never hold more than
-        # the "carry" buffer plus the current image in memory.
-        prepared_iter = []
-        # We'll iterate through files and process immediately
+        # Resized images are streamed through a target_height tile: rows are copied in
+        # until the tile is full, then it is flushed. Only the tile and the current image
+        # are ever held in memory. Full tiles go to the writer without a copy and come
+        # back through `spare_tiles` once saved, so the persistent slice buffer plus at
+        # most a queue's worth of extra tiles are allocated.
         generated_files = []
-        carry = None  # Image.Image or None, holds leftover piece smaller than target_height
         postfix = start_postfix
+        th = self.target_height
+        tile = self._slice_buf
+        spare_tiles = queue.SimpleQueue()
+        fill = 0
+        path_prefix = os.path.join(output_dir, 'seq_')
 
-        def flush_carry_slices(carry_img, postfix_start):
-            """Yield (slice_img, postfix) for all full-size slices from carry_img."""
-            out = []
-            while carry_img is not None and carry_img.height >= self.target_height:
-                slice_img = carry_img.crop((0, 0, self.target_width, self.target_height))
-                out.append((slice_img, postfix_start))
-                postfix_start += 1
-                if carry_img.height == self.target_height:
-                    carry_img = None
-                else:
-                    carry_img = carry_img.crop((0, self.target_height, self.target_width, carry_img.height))
-            return out, carry_img, postfix_start
-
-        for path in image_list:
-            with Image.open(path) as im:
-                im_rgb = self.image_convert(im, 'RGB', convert=True)
-                aspect_ratio = im_rgb.width / im_rgb.height
-                new_height = int(self.target_width / aspect_ratio)
-                cur = im_rgb.resize((self.target_width, new_height), Image.Resampling.LANCZOS)
-
-                # If there's no carry, set cur as carry and flush full slices
-                if carry is None:
-                    carry = cur
-                    out_slices, carry, postfix = flush_carry_slices(carry, postfix)
-                    for s, p in out_slices:
-                        out_name = f"seq_{p:03d}.{ext}"
-                        out_path = os.path.join(output_dir, out_name)
-                        save_kwargs = self._jpeg_save_kwargs() if save_format == 'JPEG' else {}
-                        s.save(out_path, save_format, **save_kwargs)
-                        generated_files.append(out_path)
-                    continue
-
-                # There is leftover (carry.height < target_height). Fill from cur
-                while carry is not None and carry.height < self.target_height and cur.height > 0:
-                    need = self.target_height - carry.height
-                    take_h = min(need, cur.height)
-                    top_piece = cur.crop((0, 0, self.target_width, take_h))
-                    # create combined slice
-                    combined = Image.new('RGB', (self.target_width, carry.height + take_h), (255, 255, 255))
-                    combined.paste(carry, (0, 0))
-                    combined.paste(top_piece, (0, carry.height))
-                    out_name = f"seq_{postfix:03d}.{ext}"
-                    out_path = os.path.join(output_dir, out_name)
-                    save_kwargs = self._jpeg_save_kwargs() if save_format == 'JPEG' else {}
-                    combined.save(out_path, save_format, **save_kwargs)
-                    generated_files.append(out_path)
-                    postfix += 1
-
-                    # advance cur by take_h
-                    if take_h == cur.height:
-                        cur = None
-                        carry = None
-                        break
-                    else:
-                        cur = cur.crop((0, take_h, self.target_width, cur.height))
-                        # now cur may still have full slices; set carry to None and flush cur
-                        carry = None
-
-                # If cur still exists, flush full target_height slices from it
-                if cur is not None:
-                    out_slices, carry, postfix = flush_carry_slices(cur, postfix)
-                    for s, p in out_slices:
-                        out_name = f"seq_{p:03d}.{ext}"
-                        out_path = os.path.join(output_dir, out_name)
-                        save_kwargs = self._jpeg_save_kwargs() if save_format == 'JPEG' else {}
-                        s.save(out_path, save_format, **save_kwargs)
-                        generated_files.append(out_path)
-                    # any remaining piece from cur becomes the new carry
-                    # flush_carry_slices returned residual in carry variable
-
-        # After all images processed, if carry remains (shorter than target), output it
-        if carry is not None and carry.height > 0:
-            out_name = f"seq_{postfix:03d}.{ext}"
-            out_path = os.path.join(output_dir, out_name)
-            save_kwargs = self._jpeg_save_kwargs() if save_format == 'JPEG' else {}
-            carry.save(out_path, save_format, **save_kwargs)
+        def save_slice(slice_arr, on_done=None):
+            nonlocal postfix
+            out_path = f"{path_prefix}{postfix:03d}.{ext}"
+            self._write_async(slice_arr, out_path, save_format, on_done)
             generated_files.append(out_path)
+            postfix += 1
 
-        return generated_files
-
-        # Create a single tall image by pasting each prepared image vertically
-        total_height = sum(heights)
-        if total_height == 0:
-            return []
-
-        concat = Image.new('RGB', (self.target_width, total_height), (255, 255, 255))
-        y = 0
-        for im in prepared_images:
-            concat.paste(im, (0, y))
-            y += im.height
+        def flush_tile(rows):
+            nonlocal tile
+            save_slice(tile[:rows], on_done=lambda done=tile: spare_tiles.put(done))
+            try:
+                tile = spare_tiles.get_nowait()
+            except queue.Empty:
+                tile = np.empty_like(tile)
 
-        # Slice the concatenated image into target_height strips
-        generated_files = []
-        num_slices = math.ceil(total_height / self.target_height)
-        for i in range(num_slices):
-            start_y = i * self.target_height
-            end_y = min(start_y + self.target_height, total_height)
-            slice_img = concat.crop((0, start_y, self.target_width, end_y))
-            postfix = start_postfix + i
-            # zero-padded postfix
-            output_filename = f"{postfix:03d}.png"
-            # use sequence naming: seq_<postfix> to avoid colliding with per-image naming
-            output_filename = f"seq_{postfix:03d}.png"
-            output_path = os.path.join(output_dir, output_filename)
-            slice_img.save(output_path, "PNG")
-            generated_files.append(output_path)
+        with self._writes_flushed():
+            for path in image_list:
+                src = self._load_resized(path)
+                while src.shape[0] > 0:
+                    if fill == 0 and src.shape[0] >= th:
+                        # Whole slice inside one image: save the view, no copy into the tile
+                        save_slice(src[:th])
+                        src = src[th:]
+                        continue
+                    take = min(th - fill, src.shape[0])
+                    tile[fill:fill + take] = src[:take]
+                    fill += take
+                    src = src[take:]
+                    if fill == th:
+                        flush_tile(fill)
+                        fill = 0
 
+            # After all images processed, output the partially filled tile (shorter than target)
+            if fill > 0:
+                flush_tile(fill)
         return generated_files
 
     def process_directory(self, input_dir: str, output_dir: str,
@@ -303,10 +731,20 @@ class ImageProcessor:
         Returns:
             List[str]: List of all generated image paths
         """
-        # Get all image files from directory
-        image_files = []
-        for filename in sorted(os.listdir(input_dir)):
-            if filename.lower().endswith(file_types):
-                image_files.append(os.path.join(input_dir, filename))
-                
+        image_files = list_image_files(input_dir, file_types)
         return self.process_image_list(image_files, output_dir, output_format=output_format)
+
+
+def process_image_in_worker(processor: ImageProcessor, image_path: str, output_dir: str,
+                            start_postfix: int, output_format: Optional[str] = None) -> Tuple[List[str], int]:
+    """
+    `processor.process_image` for process pool tasks.
+
+    Every task unpickles a fresh processor, and the pool already provides the
+    parallelism, so this saves synchronously instead of starting and stopping
+    `process_image`'s background writer threads for every task.
+
+    Returns:
+        Tuple[List[str], int]: (generated file paths, next postfix number)
+    """
+    return processor._slice_image(image_path, output_dir, start_postfix, output_format, processor._save_array)
@@ -0,0 +1,165 @@
+"""
+Vectorized NumPy resampling with Pillow's filters (box, bilinear, hamming, bicubic, lanczos).
+
+A separable resize is two 1-D convolutions, each a banded (dst_len x src_len) weight
+matrix. Weights depend only on (src_len, dst_len, filter), so they are computed once and
+cached; applying them is `taps` whole-array multiply-adds instead of a per-pixel kernel
+evaluation. Coefficients follow Pillow (kernel widened by the scale when shrinking).
+
+When Numba is installed both passes run as one JIT-compiled, multithreaded kernel.
+That kernel must not be entered from several threads at once (Numba's workqueue
+layer aborts, TBB can hang at exit), so callers run it from one thread at a time.
+"""
+
+import functools
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernel():
+    """
+    The Numba kernel, or None when Numba is missing or fails to import (e.g. built
+    against another NumPy). Imported on first use only, since Numba is slow to load.
+    """
+    try:
+        from ._resample_numba import apply_sep_filter
+    except ImportError:
+        return None
+    return apply_sep_filter
+
+
+def has_numba() -> bool:
+    """Whether `resize` runs the Numba kernel; imports it on the first call."""
+    return _numba_kernel() is not None
+
+
+def __getattr__(name: str):
+    # HAS_NUMBA is resolved on first access so that importing this module doesn't load Numba
+    if name == 'HAS_NUMBA':
+        return has_numba()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _box(x: np.ndarray) -> np.ndarray:
+    return ((x > -0.5) & (x <= 0.5)).astype(np.float64)
+
+
+def _bilinear(x: np.ndarray) -> np.ndarray:
+    return np.maximum(1.0 - np.abs(x), 0.0)
+
+
+def _hamming(x: np.ndarray) -> np.ndarray:
+    x = np.abs(x)
+    px = np.pi * x
+    with np.errstate(invalid='ignore', divide='ignore'):
+        w = np.sin(px) / px * (0.54 + 0.46 * np.cos(px))
+    return np.where(x == 0, 1.0, np.where(x < 1.0, w, 0.0))
+
+
+def _bicubic(x: np.ndarray, a: float = -0.5) -> np.ndarray:
+    x = np.abs(x)
+    near = ((a + 2.0) * x - (a + 3.0)) * x * x + 1
+    far = (((x - 5) * x + 8) * x - 4) * a
+    return np.where(x < 1.0, near, np.where(x < 2.0, far, 0.0))
+
+
+def _lanczos(x: np.ndarray, a: int = 3) -> np.ndarray:
+    """Lanczos window sinc(x) * sinc(x / a), zero outside |x| < a."""
+    return np.where(np.abs(x) < a, np.sinc(x) * np.sinc(x / a), 0.0)
+
+
+# name -> (kernel, support), as in Pillow's Resample.c
+FILTERS = {
+    'box': (_box, 0.5),
+    'bilinear': (_bilinear, 1.0),
+    'hamming': (_hamming, 1.0),
+    'bicubic': (_bicubic, 2.0),
+    'lanczos': (_lanczos, 3.0),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def filter_weights(src_len: int, dst_len: int, filter_name: str = 'lanczos') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Banded weights for resampling an axis of `src_len` samples to `dst_len`.
+
+    Args:
+        src_len (int): Source axis length
+        dst_len (int): Destination axis length
+        filter_name (str): One of `FILTERS`
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (starts, weights) where output sample `i` is
+        `sum(weights[i, k] * src[starts[i] + k] for k in range(weights.shape[1]))`.
+        Arrays are read-only since they are shared through the cache.
+    """
+    kernel, kernel_support = FILTERS[filter_name]
+    scale = src_len / dst_len
+    filterscale = max(scale, 1.0)
+    support = kernel_support * filterscale
+    taps = min(src_len, int(math.ceil(support)) * 2 + 1)
+
+    centers = (np.arange(dst_len) + 0.5) * scale
+    starts = np.floor(centers - support + 0.5).astype(np.intp)
+    # Keep every window inside the source; taps outside the support get zero weight
+    np.clip(starts, 0, src_len - taps, out=starts)
+
+    positions = starts[:, None] + np.arange(taps)
+    weights = kernel((positions - centers[:, None] + 0.5) / filterscale)
+    weights /= weights.sum(axis=1, keepdims=True)
+    weights = weights.astype(np.float32)
+
+    starts.setflags(write=False)
+    weights.setflags(write=False)
+    return starts, weights
+
+
+def _resample_axis(arr: np.ndarray, dst_len: int, axis: int, filter_name: str) -> np.ndarray:
+    """Resample float32 `arr` along `axis` (0 = rows, 1 = columns) to `dst_len` samples."""
+    starts, weights = filter_weights(arr.shape[axis], dst_len, filter_name)
+    out_shape = list(arr.shape)
+    out_shape[axis] = dst_len
+    out = np.zeros(out_shape, dtype=np.float32)
+    for k in range(weights.shape[1]):
+        taken = np.take(arr, starts + k, axis=axis)
+        if axis == 0:
+            out += weights[:, k, None, None] * taken
+        else:
+            out += weights[None, :, k, None] * taken
+    return out
+
+
+def resize(arr: np.ndarray, width: int, height: int, filter_name: str = 'lanczos',
+           use_numba: Optional[bool] = None) -> np.ndarray:
+    """
+    Resize an (H, W, C) uint8 array to (height, width, C).
+
+    Args:
+        arr (np.ndarray): Source image array
+        width (int): Output width
+        height (int): Output height
+        filter_name (str): One of `FILTERS`
+        use_numba (bool, optional): Use the Numba kernel (default: when it imports).
+            Falls back to NumPy if Numba is missing or fails to import
+
+    Returns:
+        np.ndarray: Resized uint8 array.
+    """
+    apply_sep_filter = _numba_kernel() if use_numba is not False else None
+    if apply_sep_filter is not None:
+        idx_rows, w_rows = filter_weights(arr.shape[0], height, filter_name)
+        idx_cols, w_cols = filter_weights(arr.shape[1], width, filter_name)
+        out_u8 = np.empty((height, width, arr.shape[2]), dtype=np.uint8)
+        apply_sep_filter(np.ascontiguousarray(arr), w_rows, idx_rows, w_cols, idx_cols, out_u8)
+        return out_u8
+
+    out = arr.astype(np.float32)
+    if arr.shape[1] != width:
+        out = _resample_axis(out, width, 1, filter_name)
+    if arr.shape[0] != height:
+        out = _resample_axis(out, height, 0, filter_name)
+    np.rint(out, out=out)
+    return np.clip(out, 0, 255, out=out).astype(np.uint8)
@@ -0,0 +1,61 @@
+import os
+import sys
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from image_processor import ImageProcessor
+from image_processor.image_processor import _has_transparency_data
+
+
+def composite_on_white(img: Image.Image) -> np.ndarray:
+    rgba = img.convert('RGBA')
+    background = Image.new('RGB', rgba.size, (255, 255, 255))
+    background.paste(rgba.convert('RGB'), mask=rgba.getchannel('A'))
+    return np.asarray(background)
+
+
+def make_inputs():
+    rng = np.random.default_rng(0)
+    rgba = Image.fromarray(rng.integers(0, 256, (32, 48, 4), dtype=np.uint8))
+    opaque = rgba.copy()
+    opaque.putalpha(255)
+    palette_keyed = rgba.convert('RGB').convert('P')
+    palette_keyed.info['transparency'] = 0
+    return {
+        'RGBA': rgba,
+        'RGBA opaque': opaque,
+        'LA': rgba.convert('LA'),
+        'PA': rgba.convert('PA'),
+        'P opaque': rgba.convert('RGB').convert('P'),
+        'P RGBA palette': rgba.convert('P'),
+        'P transparency key': palette_keyed,
+    }
+
+
+def test_image_convert_composites_on_white():
+    processor = ImageProcessor(target_width=48, target_height=32)
+    for name, img in make_inputs().items():
+        converted = processor.image_convert(img, 'RGB')
+        assert converted.mode == 'RGB', f"{name}: mode {converted.mode}"
+        assert np.array_equal(np.asarray(converted), composite_on_white(img)), f"{name}: pixels differ"
+
+
+class OldPillowImage:
+    # Stand-in for an image from Pillow < 10.1 (e.g. Pillow-SIMD 9.x): no has_transparency_data
+    def __init__(self, img: Image.Image):
+        self.info = img.info
+        self.mode = img.mode
+        self.palette = img.palette
+
+
+def test_has_transparency_data_fallback():
+    for name, img in make_inputs().items():
+        if img.mode == 'P':
+            assert _has_transparency_data(OldPillowImage(img)) == img.has_transparency_data, name
+
+
+if __name__ == '__main__':
+    test_image_convert_composites_on_white()
+    test_has_transparency_data_fallback()
+    print('Image convert tests passed.')
@@ -6,10 +6,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from image_processor import ImageProcessor
 
 
-def make_image(path: str, width: int, height: int, color=(255, 0, 0)):
+def make_image(path: str, width: int, height: int, color=(255, 0, 0), fmt: str = 'PNG'):
     os.makedirs(os.path.dirname(path), exist_ok=True)
     img = Image.new('RGB', (width, height), color)
-    img.save(path, 'PNG')
+    img.save(path, fmt)
 
 
 def test_process_directory():
@@ -52,6 +52,67 @@ def test_process_directory():
     assert all(os.path.exists(os.path.join(output_dir, f)) for f in expected), 'Some output files are missing.'
 
 
+def run_parallel(output_dir: str, **processor_kwargs):
+    base_dir = os.path.dirname(__file__)
+    test_dir = os.path.join(base_dir, 'generated_test')
+    input_dir = os.path.join(test_dir, 'input')
+    output_dir = os.path.join(test_dir, output_dir)
+
+    if os.path.exists(input_dir):
+        for f in os.listdir(input_dir):
+            os.remove(os.path.join(input_dir, f))
+    else:
+        os.makedirs(input_dir)
+
+    make_image(os.path.join(input_dir, 'a.png'), 100, 80, color=(0, 128, 255))
+    make_image(os.path.join(input_dir, 'b.png'), 100, 130, color=(0, 200, 0))
+    make_image(os.path.join(input_dir, 'c.png'), 200, 90, color=(200, 0, 0))
+    # Large JPEG, decoded at 1/8 scale (298x450): the height must come from the header
+    # (150 rows, 3 slices), not from the drafted size (151 rows, 4 slices)
+    make_image(os.path.join(input_dir, 'd.jpg'), 2384, 3596, color=(90, 40, 160), fmt='JPEG')
+
+    # Postfixes are precomputed from image headers, so numbering must match the sequential run
+    processor = ImageProcessor(target_width=100, target_height=50, max_workers=3, **processor_kwargs)
+    generated = processor.process_directory(input_dir, output_dir)
+
+    expected = [
+        'a_001.png',
+        'a_002.png',
+        'b_003.png',
+        'b_004.png',
+        'b_005.png',
+        'c_006.png',
+        'd_007.png',
+        'd_008.png',
+        'd_009.png',
+    ]
+    basenames = [os.path.basename(p) for p in generated]
+
+    assert basenames == expected, f"Generated filenames mismatch: {basenames} != {expected}"
+    assert all(os.path.exists(os.path.join(output_dir, f)) for f in expected), 'Some output files are missing.'
+    heights = []
+    for path in generated:
+        with Image.open(path) as img:
+            heights.append(img.height)
+    assert heights == [50, 30, 50, 50, 30, 45, 50, 50, 50], f"Slice heights mismatch: {heights}"
+
+
+def test_process_directory_threaded():
+    run_parallel('output_threaded')
+
+
+def test_process_directory_processes():
+    run_parallel('output_processes', use_processes=True)
+
+
+def test_process_directory_numpy_backend_workers():
+    # The Numba kernel can't be entered from several pool threads at once
+    run_parallel('output_numpy', resize_backend='numpy')
+
+
 if __name__ == '__main__':
     test_process_directory()
+    test_process_directory_threaded()
+    test_process_directory_processes()
+    test_process_directory_numpy_backend_workers()
     print('Directory processing test passed.')
@@ -0,0 +1,58 @@
+import os
+import sys
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from image_processor import ImageProcessor
+
+
+def make_image(path: str, width: int, height: int, color=(255, 0, 0)):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    img = Image.new('RGB', (width, height), color)
+    img.save(path, 'PNG')
+
+
+def test_process_sequence_list():
+    base_dir = os.path.dirname(__file__)
+    test_dir = os.path.join(base_dir, 'generated_test')
+    input_dir = os.path.join(test_dir, 'input')
+    output_dir = os.path.join(test_dir, 'output_sequence')
+
+    if os.path.exists(input_dir):
+        for f in os.listdir(input_dir):
+            os.remove(os.path.join(input_dir, f))
+    else:
+        os.makedirs(input_dir)
+
+    # Heights 80 + 10 + 130 = 220 rows -> slices of 50, 50, 50, 50, 20.
+    # b is shorter than the gap left by a, so the second slice spans a, b and c.
+    a_path = os.path.join(input_dir, 'a.png')
+    b_path = os.path.join(input_dir, 'b.png')
+    c_path = os.path.join(input_dir, 'c.png')
+    make_image(a_path, 100, 80, color=(0, 128, 255))
+    make_image(b_path, 100, 10, color=(0, 200, 0))
+    make_image(c_path, 100, 130, color=(200, 0, 0))
+
+    processor = ImageProcessor(target_width=100, target_height=50)
+    generated = processor.process_sequence_list([a_path, b_path, c_path], output_dir)
+    processor.close()
+
+    expected = ['seq_001.png', 'seq_002.png', 'seq_003.png', 'seq_004.png', 'seq_005.png']
+    basenames = [os.path.basename(p) for p in generated]
+    assert basenames == expected, f"Generated filenames mismatch: {basenames} != {expected}"
+
+    heights = []
+    for path in generated:
+        with Image.open(path) as img:
+            heights.append(img.height)
+    assert heights == [50, 50, 50, 50, 20], f"Unexpected slice heights: {heights}"
+
+    with Image.open(generated[1]) as seam:
+        assert seam.getpixel((50, 0)) == (0, 128, 255), 'Seam slice should start with image a.'
+        assert seam.getpixel((50, 35)) == (0, 200, 0), 'Seam slice should continue with image b.'
+        assert seam.getpixel((50, 49)) == (200, 0, 0), 'Seam slice should end with image c.'
+
+
+if __name__ == '__main__':
+    test_process_sequence_list()
+    print('Sequence processing test passed.')
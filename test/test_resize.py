@@ -0,0 +1,108 @@
+import os
+import sys
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from image_processor import ImageProcessor
+from image_processor.image_processor import HAS_CV2
+from image_processor import resample
+from image_processor.resample import FILTERS, HAS_NUMBA, resize
+
+
+def make_screentone(width: int, height: int, period: int = 6) -> Image.Image:
+    # Checkerboard dots finer than the output pixel grid: aliases visibly when a
+    # resize doesn't low-pass before sampling
+    y, x = np.mgrid[0:height, 0:width]
+    tone = ((((x % period) < period // 2) ^ ((y % period) < period // 2)) * 255).astype(np.uint8)
+    return Image.fromarray(np.stack([tone] * 3, axis=-1))
+
+
+def test_shrink_is_antialiased():
+    img = make_screentone(1250, 1850)
+    new_height = 1850 * 400 // 1250
+    reference = np.asarray(img.resize((400, new_height), Image.Resampling.LANCZOS)).astype(int)
+
+    backends = ['pillow', 'numpy'] + (['opencv'] if HAS_CV2 else [])
+    for backend in backends:
+        for resample_filter in ('bilinear', 'bicubic', 'lanczos'):
+            processor = ImageProcessor(400, 1280, resize_backend=backend,
+                                       resample_filter=resample_filter)
+            resized = processor._resize_to_width(img, new_height).astype(int)
+            diff = np.abs(resized - reference).mean()
+            assert diff < 8, f"{backend}/{resample_filter} shrink aliases: mean diff {diff:.1f}"
+
+
+
+def test_presized_image_is_not_resampled():
+    processor = ImageProcessor(800, 1280)
+    rng = np.random.default_rng(0)
+    for height in (1, 7, 333, 1279, 4999):
+        arr = rng.integers(0, 256, (height, 800, 3), dtype=np.uint8)
+        assert processor._scaled_height(800, height) == height, f"height {height} rounds down"
+        resized = processor._resize_to_width(Image.fromarray(arr), height)
+        assert np.array_equal(resized, arr), f"height {height}: pre-sized image was resampled"
+
+
+def test_integer_ratio_keeps_sharp_filter():
+    # 2x exact ratio: 'lanczos' must stay LANCZOS, not the box shortcut
+    img = make_screentone(800, 1200)
+    processor = ImageProcessor(400, 1280, resize_backend='pillow', resample_filter='lanczos')
+    resized = processor._resize_to_width(img, 600)
+    assert np.array_equal(resized, np.asarray(img.resize((400, 600), Image.Resampling.LANCZOS)))
+    processor = ImageProcessor(400, 1280, resize_backend='pillow', resample_filter='bilinear')
+    assert np.array_equal(processor._resize_to_width(img, 600), np.asarray(img.reduce(2)))
+
+
+
+def test_resample_matches_pillow():
+    # Pillow clamps to uint8 between its two passes, this resampler doesn't, so use a
+    # smooth image where neither pass overshoots and compare within a level
+    y, x = np.mgrid[0:300, 0:250]
+    img = np.stack([x * 255 // 250, y * 255 // 300, (x + y) * 255 // 550], axis=-1).astype(np.uint8)
+    pillow_filters = {
+        'box': Image.Resampling.BOX,
+        'bilinear': Image.Resampling.BILINEAR,
+        'hamming': Image.Resampling.HAMMING,
+        'bicubic': Image.Resampling.BICUBIC,
+        'lanczos': Image.Resampling.LANCZOS,
+    }
+    paths = [False] + ([True] if HAS_NUMBA else [])
+    for use_numba in paths:
+        for name in FILTERS:
+            for width, height in ((100, 120), (400, 480)):
+                expected = np.asarray(Image.fromarray(img).resize((width, height), pillow_filters[name]))
+                resized = resize(img, width, height, name, use_numba=use_numba)
+                diff = np.abs(resized.astype(int) - expected).max()
+                assert diff <= 1, f"{name} {width}x{height} (numba={use_numba}): max diff {diff}"
+
+
+def test_numba_import_failure_falls_back():
+    # Numba installed but refusing to import (e.g. against a newer NumPy) must not break
+    # the numpy backend: None in sys.modules makes `import numba` raise ImportError
+    saved = {name: sys.modules.pop(name, None) for name in ('numba', 'image_processor._resample_numba')}
+    sys.modules['numba'] = None
+    resample._numba_kernel.cache_clear()
+    try:
+        assert not resample.has_numba() and not resample.HAS_NUMBA
+        processor = ImageProcessor(400, 1280, resize_backend='numpy', resample_filter='lanczos')
+        assert processor.backend_info().startswith('resize: NumPy ('), processor.backend_info()
+        img = make_screentone(800, 1000)
+        expected = resize(np.asarray(img), 400, 500, 'lanczos', use_numba=False)
+        assert np.array_equal(processor._resize_to_width(img, 500), expected)
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+        resample._numba_kernel.cache_clear()
+
+
+if __name__ == '__main__':
+    test_resample_matches_pillow()
+    test_shrink_is_antialiased()
+    test_presized_image_is_not_resampled()
+    test_integer_ratio_keeps_sharp_filter()
+    test_numba_import_failure_falls_back()
+    print('Resize tests passed.')
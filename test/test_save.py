@@ -0,0 +1,133 @@
+import gc
+import os
+import sys
+import shutil
+import threading
+import weakref
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from image_processor import ImageProcessor
+from image_processor.image_processor import HAS_CV2, HAS_IMAGECODECS
+
+
+def make_output_dir(name: str) -> str:
+    output_dir = os.path.join(os.path.dirname(__file__), 'generated_test', name)
+    shutil.rmtree(output_dir, ignore_errors=True)
+    os.makedirs(output_dir)
+    return output_dir
+
+
+def test_png_encoders_round_trip():
+    output_dir = make_output_dir('output_encoders')
+    arr = np.random.default_rng(0).integers(0, 256, (90, 60, 3), dtype=np.uint8)
+    encoders = ['pillow'] + (['opencv'] if HAS_CV2 else []) + (['imagecodecs'] if HAS_IMAGECODECS else [])
+    for encoder in encoders:
+        processor = ImageProcessor(target_width=60, target_height=30, png_encoder=encoder)
+        # A row-slice view, as the slicing loops pass it
+        path = os.path.join(output_dir, f'{encoder}.png')
+        processor._save_array(arr[30:60], path, 'PNG')
+        with Image.open(path) as img:
+            assert img.format == 'PNG' and img.mode == 'RGB', f"{encoder}: {img.format} {img.mode}"
+            assert np.array_equal(np.asarray(img), arr[30:60]), f"{encoder}: pixels differ"
+
+
+def test_encoders_respect_umask():
+    # Every encoder creates its files as open(path, 'wb') does: 0o666 minus the umask
+    if os.name != 'posix':
+        return
+    output_dir = make_output_dir('output_encoders')
+    arr = np.zeros((30, 60, 3), dtype=np.uint8)
+    encoders = ['pillow'] + (['opencv'] if HAS_CV2 else []) + (['imagecodecs'] if HAS_IMAGECODECS else [])
+    old_umask = os.umask(0o002)
+    try:
+        for encoder in encoders:
+            processor = ImageProcessor(target_width=60, target_height=30, png_encoder=encoder)
+            for save_format in ('PNG', 'JPEG'):
+                path = os.path.join(output_dir, f'{encoder}.{save_format.lower()}')
+                processor._save_array(arr, path, save_format)
+                mode = os.stat(path).st_mode & 0o777
+                assert mode == 0o664, f"{encoder} {save_format}: mode {oct(mode)}"
+    finally:
+        os.umask(old_umask)
+
+
+def test_write_errors_propagate():
+    base_dir = os.path.dirname(__file__)
+    input_dir = os.path.join(base_dir, 'generated_test', 'input_errors')
+    os.makedirs(input_dir, exist_ok=True)
+    image_path = os.path.join(input_dir, 'page.png')
+    Image.new('RGB', (60, 100), (0, 128, 255)).save(image_path)
+    output_dir = make_output_dir('output_errors')
+
+    # A directory where the second slice should go makes that write fail on a writer thread
+    os.makedirs(os.path.join(output_dir, 'page_002.png'))
+    processor = ImageProcessor(target_width=60, target_height=40, io_workers=2)
+    try:
+        processor.process_image(image_path, output_dir, 1)
+    except OSError:
+        pass
+    else:
+        raise AssertionError('Write error on the writer thread was not raised.')
+
+    # The error is reported once, not again by the next, unrelated call
+    generated, _ = processor.process_image(image_path, output_dir, 10)
+    processor.close()
+    assert [os.path.basename(p) for p in generated] == ['page_010.png', 'page_011.png', 'page_012.png']
+
+
+def test_failed_sequence_flushes_writes():
+    base_dir = os.path.dirname(__file__)
+    input_dir = os.path.join(base_dir, 'generated_test', 'input_errors')
+    os.makedirs(input_dir, exist_ok=True)
+    image_path = os.path.join(input_dir, 'page.png')
+    Image.new('RGB', (60, 100), (0, 128, 255)).save(image_path)
+    output_dir = make_output_dir('output_errors')
+
+    # Slice 2 fails to write, then the second input is missing: the missing file wins,
+    # and the queued write error is not left behind for the next call
+    os.makedirs(os.path.join(output_dir, 'seq_002.png'))
+    processor = ImageProcessor(target_width=60, target_height=40)
+    missing = os.path.join(input_dir, 'missing.png')
+    try:
+        processor.process_sequence_list([image_path, missing], output_dir)
+    except FileNotFoundError:
+        pass
+    else:
+        raise AssertionError('Missing input was not raised.')
+    assert processor._io_queue.unfinished_tasks == 0, 'Writes still pending after the failure.'
+
+    generated = processor.process_sequence_list([image_path], output_dir, start_postfix=10)
+    processor.close()
+    assert [os.path.basename(p) for p in generated] == ['seq_010.png', 'seq_011.png', 'seq_012.png']
+
+
+def test_processor_needs_no_close():
+    base_dir = os.path.dirname(__file__)
+    input_dir = os.path.join(base_dir, 'generated_test', 'input_errors')
+    os.makedirs(input_dir, exist_ok=True)
+    image_path = os.path.join(input_dir, 'page.png')
+    Image.new('RGB', (60, 100), (0, 128, 255)).save(image_path)
+    output_dir = make_output_dir('output_errors')
+
+    # Writers stop before each call returns, so an unclosed processor leaves no thread
+    # behind and can be garbage collected
+    threads = threading.active_count()
+    processor = ImageProcessor(target_width=60, target_height=40, io_workers=3)
+    processor.process_image(image_path, output_dir, 1)
+    processor.process_sequence_list([image_path], output_dir)
+    assert threading.active_count() == threads, 'Writer threads outlived the call.'
+    ref = weakref.ref(processor)
+    del processor
+    gc.collect()
+    assert ref() is None, 'Unclosed processor was not collected.'
+
+
+if __name__ == '__main__':
+    test_png_encoders_round_trip()
+    test_encoders_respect_umask()
+    test_write_errors_propagate()
+    test_failed_sequence_flushes_writes()
+    test_processor_needs_no_close()
+    print('Save tests passed.')
@@ -0,0 +1,95 @@
+import io
+import os
+import sys
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from image_processor import ImageProcessor
+from image_processor import image_processor as image_processor_module
+
+
+class StubTurboJPEG:
+    # Stands in for PyTurboJPEG's TurboJPEG (its shared library isn't always installed):
+    # decodes with Pillow, using draft() + reduce() for libjpeg-turbo's 1/scale output
+    def __init__(self):
+        self.scales = []
+
+    def decode_header(self, data):
+        with Image.open(io.BytesIO(data)) as img:
+            return img.width, img.height, 0, 0
+
+    def decode(self, data, pixel_format, scaling_factor):
+        num, denom = scaling_factor
+        assert num == 1 and denom in (1, 2, 4, 8), scaling_factor
+        self.scales.append(denom)
+        with Image.open(io.BytesIO(data)) as img:
+            if img.mode not in ('RGB', 'L'):
+                raise OSError(f"Unsupported color conversion request ({img.mode})")
+            size = (-(-img.width // denom), -(-img.height // denom))
+            img.draft('RGB', size)
+            factor = img.width // size[0]
+            if factor > 1:
+                img = img.reduce(factor)
+            arr = np.asarray(img.convert('RGB'))
+        assert arr.shape[:2] == (size[1], size[0]), (arr.shape, size)
+        return arr
+
+
+class turbojpeg_stub:
+    # Swaps the stub in as the module's decoder for the duration of a `with` block
+    def __enter__(self):
+        self.stub = StubTurboJPEG()
+        self.saved = {name: getattr(image_processor_module, name, None)
+                      for name in ('HAS_TURBOJPEG', '_turbojpeg', 'TJPF_RGB')}
+        image_processor_module.HAS_TURBOJPEG = True
+        image_processor_module._turbojpeg = self.stub
+        image_processor_module.TJPF_RGB = 0
+        return self.stub
+
+    def __exit__(self, *exc):
+        for name, value in self.saved.items():
+            if value is None:
+                delattr(image_processor_module, name)
+            else:
+                setattr(image_processor_module, name, value)
+
+
+def make_jpeg(name: str, width: int, height: int, mode: str = 'RGB') -> str:
+    input_dir = os.path.join(os.path.dirname(__file__), 'generated_test', 'input_turbojpeg')
+    os.makedirs(input_dir, exist_ok=True)
+    y, x = np.mgrid[0:height, 0:width]
+    arr = np.stack([x * 255 // width, y * 255 // height, (x + y) * 255 // (width + height)], axis=-1)
+    path = os.path.join(input_dir, name)
+    Image.fromarray(arr.astype(np.uint8)).convert(mode).save(path, 'JPEG', quality=90)
+    return path
+
+
+def test_turbojpeg_decode_matches_slice_count():
+    path = make_jpeg('large.jpg', 2400, 4000)
+    processor = ImageProcessor(target_width=800, target_height=1280, resize_backend='pillow')
+    expected = processor._load_resized(path)
+    with turbojpeg_stub() as stub:
+        resized = processor._load_resized(path)
+    # Largest DCT scale still covering 800 x 1333 is 1/2, as draft() picks on the Pillow path
+    assert stub.scales == [2], stub.scales
+    assert resized.shape == (processor._scaled_height(2400, 4000), 800, 3), resized.shape
+    assert -(-resized.shape[0] // processor.target_height) == processor._slice_count(path)
+    assert np.array_equal(resized, expected), 'libjpeg-turbo path differs from the Pillow path'
+
+
+def test_turbojpeg_error_falls_back_to_pillow():
+    # libjpeg-turbo can't decode CMYK to RGB: the OSError must fall back to Pillow
+    path = make_jpeg('cmyk.jpg', 1600, 1000, mode='CMYK')
+    processor = ImageProcessor(target_width=400, target_height=1280, resize_backend='pillow')
+    with turbojpeg_stub() as stub:
+        resized = processor._load_resized(path)
+    assert stub.scales == [4], stub.scales
+    assert resized.shape == (250, 400, 3), resized.shape
+    assert np.array_equal(resized, processor._load_resized(path)), 'Fallback differs from the Pillow path'
+
+
+if __name__ == '__main__':
+    test_turbojpeg_decode_matches_slice_count()
+    test_turbojpeg_error_falls_back_to_pillow()
+    print('TurboJPEG tests passed.')